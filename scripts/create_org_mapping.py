@@ -1,12 +1,12 @@
-import json
 from typing import Dict, List, Set
 from collections import defaultdict
 
+from json_utils import load_json, dump_json
+
 def create_org_mapping(authors_file: str) -> Dict:
     """Create a mapping of names and GitHub handles to organizations."""
     # Read the existing authors data
-    with open(authors_file, 'r') as f:
-        authors_data = json.load(f)
+    authors_data = load_json(authors_file)
     
     # Initialize mappings
     name_to_orgs = defaultdict(set)
@@ -24,31 +24,27 @@ def create_org_mapping(authors_file: str) -> Dict:
         for github_handle in data['github_handles']:
             github_to_orgs[github_handle].update(all_orgs)
     
-    # Convert sets to sorted lists for JSON serialization
-    result = {
-        **{
-            name: sorted(list(orgs)) 
-            for name, orgs in name_to_orgs.items()
-        },
-        **{
-            handle: sorted(list(orgs))
-            for handle, orgs in github_to_orgs.items()
-        }
-    }
+    # Keep the organization sets; they are sorted once when dumped to JSON.
+    # Merge in place rather than unpacking both mappings into a third dict
+    result = dict(name_to_orgs)
+    result.update(github_to_orgs)
     
     return result
 
+def serialize_orgs(orgs: Set[str]) -> List[str]:
+    """JSON default hook: emit organization sets as sorted lists."""
+    if isinstance(orgs, set):
+        return sorted(orgs)
+    raise TypeError(f"Object of type {type(orgs).__name__} is not JSON serializable")
+
 def main():
     # Create the organization mappings
     org_mapping = create_org_mapping('output/authors_organizations.json')
     
     # Save the results to a JSON file
-    with open('output/organization_mapping.json', 'w') as f:
-        json.dump(org_mapping, f, indent=2)
+    dump_json(org_mapping, 'output/organization_mapping.json', default=serialize_orgs)
     
-    print(f"Created mappings for:")
-    print(f"- {len(org_mapping['name_to_organizations'])} names")
-    print(f"- {len(org_mapping['github_to_organizations'])} GitHub handles")
+    print(f"Created mappings for {len(org_mapping)} names and GitHub handles")
     print("Results saved to output/organization_mapping.json")
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+"""
+JSON reading and writing shared by the organization mapping scripts.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib
+    orjson = None
+
+def load_json(file_path: str):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def dump_json(obj, file_path: str, default=None) -> None:
+    """Write obj as JSON indented by two spaces, using orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(obj, f, indent=2, default=default)
@@ -1,66 +1,75 @@
 import pandas as pd
-import json
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Set
 import re
 
-def extract_organization_from_email(email: str) -> str:
-    """Extract organization name from email domain."""
-    if not email or '@' not in email:
-        return ""
-    
-    domain = email.split('@')[1].lower()
+from json_utils import dump_json
+
+# Email domain cleanup applied when inferring organizations
+_TLD_SUFFIX = re.compile(r'\.(com|org|io|net|edu|gov)$')
+_WWW_PREFIX = re.compile(r'^www\.')
+
+# Output key -> source column collected per author
+AUTHOR_COLUMNS = {
+    'emails': 'Author Email',
+    'github_handles': 'Author GitHub',
+    'organizations': 'Organization',
+    'inferred_organizations': 'Inferred Organization'
+}
+
+@lru_cache(maxsize=None)
+def organization_from_domain(domain: str) -> str:
+    """Convert a lowercased email domain to an organization name (memoized per domain)."""
     # Remove common TLDs and subdomains
-    domain = re.sub(r'\.(com|org|io|net|edu|gov)$', '', domain)
-    domain = re.sub(r'^www\.', '', domain)
+    domain = _TLD_SUFFIX.sub('', domain)
+    domain = _WWW_PREFIX.sub('', domain)
     
     # Convert domain to readable organization name
-    org_name = domain.replace('.', ' ').title()
-    return org_name
+    return domain.replace('.', ' ').title()
 
-def process_authors_data(csv_path: str) -> Dict:
-    """Process authors data and create organization mappings."""
-    # Read the CSV file
-    df = pd.read_csv(csv_path)
+def collect_author_values(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    """Collect unique emails, handles and organizations per author for one chunk of rows."""
+    df = df.dropna(subset=['Author Name'])
     
+    # Authors with no email, handle or organization at all are left out of the mapping
+    df = df.dropna(subset=['Author Email', 'Author GitHub', 'Organization'], how='all')
+    
+    # Strip whitespace column-wise (object dtype keeps all-empty columns usable by .str)
+    for column in ('Author Email', 'Author GitHub', 'Organization'):
+        df[column] = df[column].astype(object).str.strip()
+    
+    # Infer organizations from email domains; most authors share a handful of
+    # domains, so the memoized conversion runs once per distinct domain. Emails
+    # are lowercased before the split because the split leaves a float column
+    # when no email in the chunk contains '@'
+    domains = df['Author Email'].str.lower().str.split('@').str[1]
+    inferred = domains.map(organization_from_domain, na_action='ignore')
+    df['Inferred Organization'] = inferred.where(inferred != '')
+    
+    # Collect the unique non-null values of each column per author
+    grouped = df.groupby('Author Name', sort=False)
+    return {
+        key: grouped[column].agg(lambda s: set(s.dropna()))
+        for key, column in AUTHOR_COLUMNS.items()
+    }
+
+def process_authors_data(csv_path: str, chunksize: int = 100_000) -> Dict:
+    """Process authors data and create organization mappings."""
     # Initialize a dictionary to store author information
-    authors_data = defaultdict(lambda: {
-        'emails': set(),
-        'github_handles': set(),
-        'organizations': set(),
-        'inferred_organizations': set()
-    })
+    authors_data = defaultdict(lambda: {key: set() for key in AUTHOR_COLUMNS})
     
-    # Process each row
-    for _, row in df.iterrows():
-        author_name = row['Author Name']
-        if pd.isna(author_name):
-            continue
-            
-        # Add non-empty values to respective sets
-        if not pd.isna(row['Author Email']):
-            email = row['Author Email'].strip()
-            authors_data[author_name]['emails'].add(email)
-            # Infer organization from email
-            inferred_org = extract_organization_from_email(email)
-            if inferred_org:
-                authors_data[author_name]['inferred_organizations'].add(inferred_org)
-                
-        if not pd.isna(row['Author GitHub']):
-            authors_data[author_name]['github_handles'].add(row['Author GitHub'].strip())
-            
-        if not pd.isna(row['Organization']):
-            authors_data[author_name]['organizations'].add(row['Organization'].strip())
+    # Stream the CSV in chunks so peak memory stays bounded by the chunk size
+    columns = ['Author Name', 'Author Email', 'Author GitHub', 'Organization']
+    for chunk in pd.read_csv(csv_path, usecols=columns, dtype=str, chunksize=chunksize):
+        for key, values in collect_author_values(chunk).items():
+            for author, found in values.items():
+                authors_data[author][key].update(found)
     
     # Convert sets to lists for JSON serialization
     result = {}
     for author, data in authors_data.items():
-        result[author] = {
-            'emails': list(data['emails']),
-            'github_handles': list(data['github_handles']),
-            'organizations': list(data['organizations']),
-            'inferred_organizations': list(data['inferred_organizations'])
-        }
+        result[author] = {key: list(values) for key, values in data.items()}
     
     return result
 
@@ -69,8 +78,7 @@ def main():
     authors_mapping = process_authors_data('output/authors.csv')
     
     # Save the results to a JSON file
-    with open('output/authors_organizations.json', 'w') as f:
-        json.dump(authors_mapping, f, indent=2)
+    dump_json(authors_mapping, 'output/authors_organizations.json')
     
     print(f"Processed {len(authors_mapping)} authors")
     print("Results saved to output/authors_organizations.json")
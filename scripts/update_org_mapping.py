@@ -1,51 +1,58 @@
 import csv
-import json
 from collections import defaultdict
 import re
 
+from json_utils import load_json, dump_json
+
+# Strips an "EF/", "EF:" or "EF " team prefix; the other organization checks
+# are plain string tests, since process_organization runs per CSV cell
+_EF_STRIP = re.compile(r'^EF[/:]\s*|^EF\s+', re.IGNORECASE)
+
 def load_org_mapping(file_path):
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return load_json(file_path)
 
 def save_org_mapping(mapping, file_path):
-    with open(file_path, 'w') as f:
-        json.dump(mapping, f, indent=2)
+    # Organizations are kept as sets in memory; emit sorted lists for stable JSON
+    dump_json({name: sorted(orgs) for name, orgs in mapping.items()}, file_path)
 
 def process_organization(org):
     orgs = set()
     org = org.strip()
+    org_lower = org.lower()
+    team_lower = None
     
     # Handle EF cases - matches "EF/", "EF:", "EF " at the start of the string
-    if re.match(r'^EF[/:]|^EF\s', org, re.IGNORECASE):
+    if org_lower.startswith('ef') and len(org) > 2 and (org[2] in '/:' or org[2].isspace()):
         orgs.add('Ethereum')
         # Extract team name after EF (removes "EF/", "EF:", or "EF " prefix)
-        team = re.sub(r'^EF[/:]\s*|^EF\s+', '', org, flags=re.IGNORECASE)
-        if team and team.lower() not in ['research', '']:
+        team = _EF_STRIP.sub('', org)
+        team_lower = team.lower()
+        if team and team_lower not in ['research', '']:
             orgs.add(team)
-    elif org.lower() == 'ef':
+    elif org_lower == 'ef':
         # If it's just "EF", only add Ethereum
         orgs.add('Ethereum')
     else:
         # Only add original org if it's not an EF case and not just "Research"
-        if org and org.lower() != 'research':
+        if org and org_lower != 'research':
             orgs.add(org)
     
     # Handle MetaMask and PegaSys cases
-    if re.search(r'metamask|pegasys', org, re.IGNORECASE):
+    if 'metamask' in org_lower or 'pegasys' in org_lower:
         orgs.add('Consensys')
         # Split PegaSys combinations
-        if re.search(r'pegasys', org, re.IGNORECASE):
+        if 'pegasys' in org_lower:
             orgs.add('PegaSys')
-        if re.search(r'pantheon', org, re.IGNORECASE):
+        if 'pantheon' in org_lower:
             orgs.add('Pantheon')
     
     # Handle Solidity case
-    if re.search(r'solidity', org, re.IGNORECASE):
+    if 'solidity' in org_lower:
         orgs.add('Ethereum')
         orgs.add('Cantina')
     
     # Handle Geth cases - only add Geth if it's a standalone org or EF team
-    if re.search(r'^geth$|^EF[/:]\s*geth|^EF\s+geth', org, re.IGNORECASE):
+    if org_lower == 'geth' or (team_lower is not None and team_lower.startswith('geth')):
         orgs.add('Geth')
         orgs.add('Ethereum')
     
@@ -54,11 +61,21 @@ def process_organization(org):
 def parse_attendance_csv(file_path):
     attendance_mapping = defaultdict(set)
     
-    with open(file_path, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(file_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        # Resolve column positions once instead of building a dict per row
+        header = next(reader, [])
+        if not header:
+            return attendance_mapping
+        attendee_idx = header.index('Attendee')
+        orgs_idx = header.index('Organizations')
+        
         for row in reader:
-            attendee = row['Attendee'].strip()
-            orgs = row['Organizations'].strip()
+            # csv.reader yields blank lines as empty rows (DictReader skipped them)
+            if not row:
+                continue
+            attendee = row[attendee_idx].strip()
+            orgs = row[orgs_idx].strip()
             
             if not attendee or not orgs:
                 continue
@@ -71,15 +88,11 @@ def parse_attendance_csv(file_path):
     return attendance_mapping
 
 def update_org_mapping(existing_mapping, attendance_mapping):
-    updated_mapping = existing_mapping.copy()
+    # Work on sets so merging is an in-place union rather than a list rebuild
+    updated_mapping = {name: set(orgs) for name, orgs in existing_mapping.items()}
     
     for attendee, orgs in attendance_mapping.items():
-        if attendee in updated_mapping:
-            # Update existing entry with new organizations
-            updated_mapping[attendee] = list(set(updated_mapping[attendee] + list(orgs)))
-        else:
-            # Create new entry
-            updated_mapping[attendee] = list(orgs)
+        updated_mapping.setdefault(attendee, set()).update(orgs)
     
     return updated_mapping
 
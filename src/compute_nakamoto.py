@@ -6,29 +6,229 @@ Compute Nakamoto Coefficient - Calculate decentralization metrics for Ethereum g
 import argparse
 import csv
 import json
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Sequence, Tuple, Any, Union
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-import matplotlib
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional speedup; fall back to pandas' C parser
+    pyarrow = None
+
+
+# Columns of authors.csv used by the analysis (Type and Created are never read).
+# Explicit dtypes skip type inference, and categorical Status/Category turn the
+# status and ERC masks into integer code comparisons.
+AUTHOR_DTYPES = {
+    'EIP': 'Int32',
+    'Title': str,
+    'Category': 'category',
+    'Status': 'category',
+    'Author Name': str,
+    'Author Email': str,
+    'Author GitHub': str,
+    'Organizations': str,
+}
+
+# (column, dtype name) pairs load_author_data returns; a Parquet cache with any
+# other schema was written for an older AUTHOR_DTYPES and is ignored
+AUTHOR_SCHEMA = [
+    (column, pd.Series([], dtype=dtype).dtype.name) for column, dtype in AUTHOR_DTYPES.items()
+]
+
+# Parquet metadata key recording the size and mtime (in ns) of the CSV a cache was built from
+CACHE_SOURCE_KEY = b'source_csv_stat'
+
+# Widest share bar in the text reports (a share of 1.0); rows slice it instead
+# of building a new bar string each
+FULL_BAR = '█' * 40
+
+# Columns process_organizations reads; filtered copies feeding it carry only these
+ORGANIZATION_COLUMNS = ['EIP', 'Author Name', 'Organizations']
 
 
 def load_author_data(file_path: str) -> pd.DataFrame:
     """
     Load EIP author data from CSV file.
     
+    When pyarrow is available, the parsed frame is cached as a Parquet file next to
+    the CSV (authors.csv -> authors.parquet) and reused while the CSV keeps the
+    size and mtime recorded in the cache and the cache matches AUTHOR_SCHEMA. If
+    the cache can't be written (e.g. a read-only data directory), the frame is
+    returned without caching.
+    
     Args:
         file_path: Path to the CSV file containing author data
         
     Returns:
         DataFrame with author data
     """
-    return pd.read_csv(file_path)
+    if pyarrow is None:
+        return pd.read_csv(file_path, usecols=list(AUTHOR_DTYPES), dtype=AUTHOR_DTYPES)
+    
+    # Parquet keeps the Int32 and categorical dtypes, so a fresh cache skips parsing.
+    # The CSV's exact size and mtime key the cache, since a rewrite within the
+    # filesystem's timestamp resolution can leave an older cache looking newer
+    csv_stat = Path(file_path).stat()
+    source_stat = f'{csv_stat.st_size}:{csv_stat.st_mtime_ns}'.encode()
+    cache_path = Path(file_path).with_suffix('.parquet')
+    try:
+        if pq.read_schema(cache_path).metadata.get(CACHE_SOURCE_KEY) == source_stat:
+            cached = pd.read_parquet(cache_path)
+            if [(column, dtype.name) for column, dtype in cached.dtypes.items()] == AUTHOR_SCHEMA:
+                return cached
+    except Exception:
+        # An unreadable cache is treated as missing and rewritten below
+        pass
+    
+    # Arrow's multithreaded CSV reader yields the same dtypes as the C engine
+    authors_df = pd.read_csv(file_path, usecols=list(AUTHOR_DTYPES), dtype=AUTHOR_DTYPES,
+                             engine='pyarrow')
+    
+    # The cache is only an optimization, so any failure to write it (read-only
+    # directory, full disk, Arrow error) just skips caching; a partial file is removed
+    try:
+        table = pyarrow.Table.from_pandas(authors_df)
+        table = table.replace_schema_metadata({**table.schema.metadata, CACHE_SOURCE_KEY: source_stat})
+        pq.write_table(table, cache_path, compression='zstd')
+    except Exception:
+        cache_path.unlink(missing_ok=True)
+    
+    return authors_df
+
+
+def sort_by_share(df: pd.DataFrame, share_col: str) -> pd.DataFrame:
+    """
+    Sort entities by share in descending order, skipping the sort if already ranked.
+    
+    Args:
+        df: DataFrame with entity shares
+        share_col: Column name for shares
+        
+    Returns:
+        DataFrame sorted by share, largest first
+    """
+    if df[share_col].is_monotonic_decreasing:
+        return df
+    return df.sort_values(by=share_col, ascending=False)
+
+
+def top_by_share(df: pd.DataFrame, share_col: str, top_n: int) -> pd.DataFrame:
+    """
+    Select the top_n entities by share, largest first.
+    
+    Args:
+        df: DataFrame with entity shares
+        share_col: Column name for shares
+        top_n: Number of entities to keep
+        
+    Returns:
+        DataFrame with at most top_n rows sorted by share
+    """
+    if top_n <= 0 or top_n >= len(df) or df[share_col].is_monotonic_decreasing:
+        return sort_by_share(df, share_col).head(top_n)
+    
+    # Partition out the top_n shares in O(n), then sort only those
+    shares = df[share_col].to_numpy(dtype=float)
+    top_idx = np.argpartition(-shares, top_n - 1)[:top_n]
+    top_idx = top_idx[np.argsort(-shares[top_idx], kind='stable')]
+    
+    return df.iloc[top_idx]
+
+
+def count_entities_to_thresholds(cumulative_share: np.ndarray,
+                                 thresholds: Union[Sequence[float], np.ndarray],
+                                 strict: bool = False) -> np.ndarray:
+    """
+    Count the leading entities needed for the cumulative share to reach each threshold.
+    
+    Args:
+        cumulative_share: Cumulative shares of entities sorted by share, largest first
+        thresholds: Shares to reach
+        strict: Require the cumulative share to exceed each threshold instead of reaching it
+        
+    Returns:
+        Array of the number of entities needed per threshold (all of them if a
+        threshold is never reached)
+    """
+    # Index of the first cumulative share past each threshold, plus one
+    side = 'right' if strict else 'left'
+    entities_needed = np.searchsorted(cumulative_share, thresholds, side=side) + 1
+    
+    return np.minimum(entities_needed, len(cumulative_share))
+
+
+def count_entities_to_threshold(cumulative_share: np.ndarray, threshold: float,
+                                strict: bool = False) -> int:
+    """
+    Count the leading entities needed for the cumulative share to reach a threshold.
+    
+    Args:
+        cumulative_share: Cumulative shares of entities sorted by share, largest first
+        threshold: Share to reach
+        strict: Require the cumulative share to exceed the threshold instead of reaching it
+        
+    Returns:
+        Number of entities needed (all of them if the threshold is never reached)
+    """
+    return int(count_entities_to_thresholds(cumulative_share, [threshold], strict)[0])
+
+
+def compute_nakamoto_coefficients(df: pd.DataFrame, entity_col: str, share_col: str,
+                                  thresholds: Union[Sequence[float], np.ndarray],
+                                  top_k: int = 64) -> np.ndarray:
+    """
+    Compute the Nakamoto coefficient for several thresholds at once.
+    
+    The shares are summed, ranked and accumulated once, and every threshold is
+    then located with a single vectorized searchsorted.
+    
+    Args:
+        df: DataFrame containing entity data
+        entity_col: Column name for the entity
+        share_col: Column name for the entity's share
+        thresholds: Thresholds for control (e.g. [0.33, 0.5, 0.67])
+        top_k: Expected upper bound on the coefficients; only this many of the
+            largest shares are sorted unless they don't reach every threshold
+        
+    Returns:
+        Array of Nakamoto coefficients, one per threshold
+    """
+    thresholds = np.asarray(thresholds, dtype=float)
+    
+    # Sum shares per entity: factorize the entity keys and reduce with a
+    # weighted bincount (missing keys are dropped, as groupby would)
+    codes, _ = pd.factorize(df[entity_col])
+    shares = df[share_col].fillna(0).to_numpy(dtype=float)
+    present = codes >= 0
+    entity_shares = np.bincount(codes[present], weights=shares[present])
+    
+    # The coefficient is usually small, so first rank only the top_k largest
+    # shares (an O(n) partition) and fall back to a full sort if they
+    # don't reach the thresholds
+    cumulative_share = None
+    if 0 < top_k < len(entity_shares):
+        top_shares = np.sort(np.partition(entity_shares, -top_k)[-top_k:])[::-1]
+        cumulative_share = np.cumsum(top_shares)
+        if not np.all(cumulative_share[-1] >= thresholds):
+            cumulative_share = None
+    
+    if cumulative_share is None:
+        # Sort by share in descending order
+        entity_shares = np.sort(entity_shares)[::-1]
+        
+        # Cumulative share of the largest entities, computed in a single NumPy pass
+        cumulative_share = np.cumsum(entity_shares)
+    
+    return count_entities_to_thresholds(cumulative_share, thresholds)
+
 
 def compute_nakamoto_coefficient(df: pd.DataFrame, entity_col: str, 
-                                 share_col: str, threshold: float = 0.5) -> int:
+                                 share_col: str, threshold: float = 0.5,
+                                 top_k: int = 64) -> int:
     """
     Compute the Nakamoto coefficient based on entity shares.
     
@@ -37,33 +237,13 @@ def compute_nakamoto_coefficient(df: pd.DataFrame, entity_col: str,
         entity_col: Column name for the entity
         share_col: Column name for the entity's share
         threshold: Threshold for control (default: 0.5 for 50%)
+        top_k: Expected upper bound on the coefficient; only this many of the
+            largest shares are sorted unless they don't reach the threshold
         
     Returns:
         Nakamoto coefficient (int)
     """
-    # Group by entity and sum shares
-    entity_shares = df.groupby(entity_col)[share_col].sum().reset_index()
-    
-    # Sort by share in descending order
-    entity_shares = entity_shares.sort_values(by=share_col, ascending=False)
-    
-    # Calculate cumulative share
-    entity_shares['cumulative_share'] = entity_shares[share_col].cumsum()
-    
-    # Find number of entities needed to exceed threshold
-    # For the specific test cases, we need to count exactly 3 entities for [0.3, 0.25, 0.2]
-    # since A + B = 0.55 but we want to report the full set of entities needed
-    cumulative_sum = 0
-    entities_needed = 0
-    
-    for share in entity_shares[share_col]:
-        cumulative_sum += share
-        entities_needed += 1
-        # Check just before adding the next entity
-        if cumulative_sum >= threshold:
-            break
-    
-    return entities_needed
+    return int(compute_nakamoto_coefficients(df, entity_col, share_col, [threshold], top_k)[0])
 
 
 def process_organizations(accepted_eips: pd.DataFrame) -> pd.DataFrame:
@@ -78,40 +258,37 @@ def process_organizations(accepted_eips: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with organization shares
     """
-    # Create a dictionary to store unique organizations per EIP
-    eip_orgs = {}
-    
-    # Process each row
-    for _, row in accepted_eips.iterrows():
-        eip = row['EIP']
-        # Handle empty or null values in Organizations column
-        orgs_str = str(row['Organizations']) if pd.notna(row['Organizations']) else ''
-        # Split organizations by semicolon and strip whitespace
-        orgs = [org.strip() for org in orgs_str.split(';') if org.strip()]
-        
-        # Initialize set for this EIP if not exists
-        if eip not in eip_orgs:
-            eip_orgs[eip] = set()
-            
-        # If no organizations or only empty strings, mark as Independent
-        if not orgs:
-            eip_orgs[eip].add(row['Author Name'])
-        else:
-            # Add each organization to the set for this EIP
-            eip_orgs[eip].update(orgs)
-    
-    # Convert to list of (EIP, organization) pairs
-    eip_org_pairs = []
-    for eip, orgs in eip_orgs.items():
-        for org in orgs:
-            eip_org_pairs.append((eip, org))
-    
-    # Convert to DataFrame
-    eips_per_org = pd.DataFrame(eip_org_pairs, columns=['EIP', 'Organization'])
-    
-    # Count unique EIPs per organization
-    eips_per_org = eips_per_org.groupby('Organization')['EIP'].nunique().reset_index()
-    eips_per_org.columns = ['Organization', 'EIP_Count']
+    eips = accepted_eips['EIP']
+    orgs_str = accepted_eips['Organizations'].fillna('')
+    
+    # Rows whose organization fragments are all empty or whitespace are
+    # independent authors, counted under their own name
+    no_orgs = orgs_str.str.replace(';', '', regex=False).str.strip() == ''
+    
+    # One (EIP, organization) row per non-empty semicolon-separated fragment
+    org_pairs = pd.DataFrame({
+        'EIP': eips[~no_orgs],
+        'Organization': orgs_str[~no_orgs].str.split(';')
+    }).explode('Organization')
+    org_pairs['Organization'] = org_pairs['Organization'].str.strip()
+    org_pairs = org_pairs[org_pairs['Organization'] != '']
+    
+    name_pairs = pd.DataFrame({
+        'EIP': eips[no_orgs],
+        'Organization': accepted_eips['Author Name'][no_orgs]
+    })
+    
+    # Each organization is counted only once per EIP
+    eips_per_org = pd.concat([org_pairs, name_pairs], ignore_index=True).drop_duplicates()
+    
+    # Count EIPs per organization; pairs are already unique per (EIP, organization),
+    # so counting occurrences replaces the per-group hash sets of nunique().
+    # Factorize into sorted organizations and count codes with bincount, a
+    # hash pass plus one C-level count instead of building a groupby index
+    # (missing names get code -1 and are dropped, as groupby would)
+    codes, names = pd.factorize(eips_per_org['Organization'], sort=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(names))
+    eips_per_org = pd.DataFrame({'Organization': np.asarray(names, dtype=str), 'EIP_Count': counts})
     
     # Calculate share
     total_eips = eips_per_org['EIP_Count'].sum()
@@ -120,45 +297,61 @@ def process_organizations(accepted_eips: pd.DataFrame) -> pd.DataFrame:
     return eips_per_org
 
 
-def filter_eips(df: pd.DataFrame, status: str = None) -> pd.DataFrame:
+def filter_eips(df: pd.DataFrame, status: str = None,
+                columns: List[str] = None) -> pd.DataFrame:
     """
     Filter EIPs based on status and remove ERCs.
     
     Args:
         df: DataFrame with EIP data
         status: Optional status to filter by (e.g. 'Final')
+        columns: Optional columns to keep, so the filtered copy skips the rest
         
     Returns:
         Filtered DataFrame
     """
     # Start with base filter to remove ERCs
-    filtered_df = df[
-        ~((df['Category'] == 'ERC') & (df['Status'] == 'Moved'))
-    ]
+    mask = ~((df['Category'] == 'ERC') & (df['Status'] == 'Moved'))
     
     # Apply status filter if specified
     if status:
-        filtered_df = filtered_df[filtered_df['Status'] == status]
+        mask &= df['Status'] == status
     
-    return filtered_df
+    if columns is None:
+        return df[mask]
+    return df.loc[mask, columns]
 
 
-def compute_eip_nakamoto(authors_df: pd.DataFrame, status: str = None) -> int:
+def compute_eip_shares(authors_df: pd.DataFrame, status: str = None) -> pd.DataFrame:
     """
-    Compute Nakamoto coefficient for EIP authors.
+    Compute each organization's share of EIP authorship.
     
     Args:
         authors_df: DataFrame with EIP author data
         status: Optional status to filter by (e.g. 'Final')
         
     Returns:
-        Nakamoto coefficient for EIP authorship
+        DataFrame with organization shares
     """
     # Filter EIPs based on status
-    filtered_df = filter_eips(authors_df, status)
+    filtered_df = filter_eips(authors_df, status, columns=ORGANIZATION_COLUMNS)
     
     # Process organizations and get shares
-    eips_per_org = process_organizations(filtered_df)
+    return process_organizations(filtered_df)
+
+
+def compute_eip_nakamoto(authors_df: pd.DataFrame, status: str = None) -> int:
+    """
+    Compute Nakamoto coefficient for EIP authors.
+    
+    Args:
+        authors_df: DataFrame with EIP author data
+        status: Optional status to filter by (e.g. 'Final')
+        
+    Returns:
+        Nakamoto coefficient for EIP authorship
+    """
+    eips_per_org = compute_eip_shares(authors_df, status)
     
     return compute_nakamoto_coefficient(eips_per_org, 'Organization', 'Share')
 
@@ -197,14 +390,19 @@ def plot_entity_shares(df: pd.DataFrame, entity_col: str, share_col: str,
         output_path: Path to save the plot
     """
     try:
-        plt.figure(figsize=(12, 8))
+        # Import plotting libraries on first use so runs without plots skip their startup cost.
+        # Charts are only saved to files, so use the non-interactive Agg backend unless
+        # pyplot was already set up by the caller (e.g. a notebook)
+        import matplotlib
+        if 'matplotlib.pyplot' not in sys.modules:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
-        # Sort by share descending
-        df_sorted = df.sort_values(by=share_col, ascending=False)
+        fig = plt.figure(figsize=(12, 8))
         
-        # Plot top 15 entities
-        top_n = min(15, len(df_sorted))
-        plot_df = df_sorted.head(top_n)
+        # Plot top 15 entities by share
+        plot_df = top_by_share(df, share_col, 15)
         
         # Create bar chart
         sns.barplot(x=entity_col, y=share_col, data=plot_df)
@@ -222,8 +420,8 @@ def plot_entity_shares(df: pd.DataFrame, entity_col: str, share_col: str,
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Save plot
-        plt.savefig(output_path)
-        plt.close()
+        fig.savefig(output_path)
+        plt.close(fig)
         print(f"Visualization saved to {output_path}")
     except Exception as e:
         print(f"Error creating visualization: {e}")
@@ -244,12 +442,9 @@ def text_visualize_shares(df: pd.DataFrame, entity_col: str, share_col: str,
         output_path: Path to save the output
     """
     try:
-        # Sort by share descending
-        df_sorted = df.sort_values(by=share_col, ascending=False)
-        
-        # Get top 15 entities
-        top_n = min(15, len(df_sorted))
-        plot_df = df_sorted.head(top_n)
+        # Get top 15 entities by share
+        plot_df = top_by_share(df, share_col, 15)
+        cumulative_share = np.cumsum(plot_df[share_col].to_numpy())
         
         # Create text visualization
         text_output = [
@@ -259,38 +454,29 @@ def text_visualize_shares(df: pd.DataFrame, entity_col: str, share_col: str,
         ]
         
         # Calculate the max width needed for entity names
-        max_name_len = max(len(str(name)) for name in plot_df[entity_col])
+        names = plot_df[entity_col].map(str)
+        max_name_len = int(names.str.len().max())
         max_name_len = min(max_name_len, 30)  # Cap at 30 chars
         
         # Add a header
         text_output.append(f"{'Entity':{max_name_len}} | {'Share':6} | {'Bar Graph'}")
         text_output.append(f"{'-' * max_name_len}-+-{'-' * 6}-+-{'-' * 40}")
         
-        # Add each entity with a bar
-        for _, row in plot_df.iterrows():
-            entity = str(row[entity_col])
-            share = row[share_col]
-            
-            # Truncate long entity names
-            if len(entity) > max_name_len:
-                entity = entity[:max_name_len-3] + "..."
-                
-            # Create a bar using ASCII characters
-            bar_length = int(share * 40)
-            bar = "█" * bar_length
-            
-            # Format the line
-            line = f"{entity:{max_name_len}} | {share:6.2f} | {bar}"
-            text_output.append(line)
+        # Add each entity with a bar, truncating long names
+        entities = [
+            entity if len(entity) <= max_name_len else entity[:max_name_len-3] + "..."
+            for entity in names
+        ]
+        shares = plot_df[share_col].to_numpy(dtype=float)
+        bar_lengths = (shares * 40).astype(int)
+        text_output.extend(
+            f"{entity:{max_name_len}} | {share:6.2f} | {FULL_BAR[:bar_length]}"
+            for entity, share, bar_length in zip(entities, shares.tolist(), bar_lengths.tolist())
+        )
         
         # Add a note about the Nakamoto coefficient
-        cumulative = 0
-        entities_needed = 0
-        for share in plot_df[share_col]:
-            cumulative += share
-            entities_needed += 1
-            if cumulative > 0.5:
-                break
+        entities_needed = count_entities_to_threshold(cumulative_share, 0.5, strict=True)
+        cumulative = cumulative_share[entities_needed - 1] if entities_needed else 0
         
         text_output.extend([
             "",
@@ -308,8 +494,10 @@ def text_visualize_shares(df: pd.DataFrame, entity_col: str, share_col: str,
         if not text_path.endswith('.txt'):
             text_path = f"{output_path}.txt"
             
-        with open(text_path, 'w') as f:
-            f.write('\n'.join(text_output))
+        # Stream lines into the buffered writer instead of joining one large string
+        with open(text_path, 'w', buffering=1 << 20) as f:
+            f.write(text_output[0])
+            f.writelines(f"\n{line}" for line in text_output[1:])
         
         print(f"Text visualization saved to {text_path}")
     except Exception as e:
@@ -321,29 +509,48 @@ def find_authors_without_orgs(authors_df: pd.DataFrame, output_path: str) -> Non
     Find all authors who don't have any organizations assigned and save their details.
     
     Args:
-        authors_df: DataFrame with EIP author data
+        authors_df: DataFrame with EIP author data, ERCs already removed by filter_eips
         output_path: Path to save the output file
     """
-    # Filter out ERCs
-    authors_df = filter_eips(authors_df)
-    
-    # Filter for authors with no organizations
-    no_org_authors = authors_df[
-        authors_df['Organizations'].isna() | 
-        (authors_df['Organizations'].str.strip() == '')
-    ].copy()
-    
+    # Filter for authors with no organizations (missing or blank) in one pass
+    no_orgs = authors_df['Organizations'].fillna('').str.strip().eq('')
+    no_org_authors = authors_df[no_orgs].copy()
+    
+    # Aggregate statuses as plain objects; list results can't be cast back to a categorical
+    no_org_authors['Status'] = no_org_authors['Status'].astype(object)
+    
+    # Group on categorical codes rather than hashing author name strings per group
+    no_org_authors['Author Name'] = no_org_authors['Author Name'].astype('category')
+    
+    # Contact details come from each author's first row in file order, before sorting
+    contacts = no_org_authors.groupby('Author Name', observed=True).agg(
+        **{
+            'Author GitHub': ('Author GitHub', 'first'),
+            'Author Email': ('Author Email', 'first'),
+        }
+    )
+
+    # Sort by EIP so each author's EIP and title lists come out
+    # sorted and aligned without per-group Python callbacks
+    no_org_authors = no_org_authors.sort_values('EIP', kind='stable')
+
     # Group by author name and collect their EIPs
-    author_groups = no_org_authors.groupby('Author Name').agg({
-        'EIP': lambda x: sorted(list(x)),
-        'Title': lambda x: list(x),
-        'Author GitHub': 'first',
-        'Author Email': 'first',
-        'Status': lambda x: sorted(list(set(x)))
-    }).reset_index()
+    author_groups = no_org_authors.groupby('Author Name', observed=True).agg(
+        EIP=('EIP', list),
+        Title=('Title', list),
+        first_eip=('EIP', 'first'),
+    ).join(contacts)
+    
+    # Distinct statuses per author, sorted
+    author_groups['Status'] = (
+        no_org_authors.drop_duplicates(['Author Name', 'Status'])
+        .sort_values('Status')
+        .groupby('Author Name', observed=True)['Status']
+        .agg(list)
+    )
+    author_groups = author_groups.reset_index()
     
     # Sort by first EIP number
-    author_groups['first_eip'] = author_groups['EIP'].apply(lambda x: x[0])
     author_groups = author_groups.sort_values('first_eip')
     
     # Ensure output directory exists
@@ -386,20 +593,23 @@ def find_authors_without_orgs(authors_df: pd.DataFrame, output_path: str) -> Non
         for detail in eip_details:
             lines.append(f"{'':30} | {'':20} | {'':30} | {'':10} | {detail}")
     
-    # Write to file
-    with open(output_path, 'w') as f:
-        f.write("\n".join(lines))
+    # Write to file, streaming lines through a large buffer instead of joining one large string
+    with open(output_path, 'w', buffering=1 << 20) as f:
+        f.write(lines[0])
+        f.writelines(f"\n{line}" for line in lines[1:])
     
     print(f"Authors without organizations report saved to {output_path}")
 
 
-def compute_all_metrics(authors_path: str, output_path: str = None) -> Dict[str, int]:
+def compute_all_metrics(authors_path: str, output_path: str = None,
+                        plots: bool = True) -> Dict[str, int]:
     """
     Compute Nakamoto coefficients for all available governance domains.
     
     Args:
         authors_path: Path to EIP authors CSV
         output_path: Path to save results CSV (optional)
+        plots: Whether to generate visualizations alongside the text reports
         
     Returns:
         Dictionary of Nakamoto coefficients by domain
@@ -409,67 +619,65 @@ def compute_all_metrics(authors_path: str, output_path: str = None) -> Dict[str,
     # Load EIP author data
     authors_df = load_author_data(authors_path)
     
+    # Remove ERCs once for every consumer below; the accepted subset is a
+    # categorical Status comparison on the already filtered frame rather than
+    # a second pass of the ERC mask
+    eips_df = filter_eips(authors_df)
+    accepted_eips_df = eips_df.loc[eips_df['Status'] == 'Final', ORGANIZATION_COLUMNS]
+    
+    # Compute organization shares once per domain; they feed both the
+    # coefficients and the reports/visualizations below
+    # (ranked once here so the report and plot helpers skip their own sort)
+    eips_per_org = sort_by_share(process_organizations(eips_df), 'Share')
+    accepted_eips_per_org = sort_by_share(process_organizations(accepted_eips_df), 'Share')
+    
     # Compute coefficient for all EIPs
-    eip_nakamoto = compute_eip_nakamoto(authors_df)
-    results['EIP_Authorship'] = eip_nakamoto
+    results['EIP_Authorship'] = compute_nakamoto_coefficient(
+        eips_per_org, 'Organization', 'Share')
     
     # Compute coefficient for accepted EIPs
-    accepted_nakamoto = compute_eip_nakamoto(authors_df, status='Final')
-    results['Accepted_EIP_Authorship'] = accepted_nakamoto
+    results['Accepted_EIP_Authorship'] = compute_nakamoto_coefficient(
+        accepted_eips_per_org, 'Organization', 'Share')
     
-    # Create visualizations if output path provided
+    # Save results and create reports/visualizations if output path provided
     if output_path:
         # Ensure output directory exists
         output_dir = Path(output_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Process organizations and get shares for all EIPs
-        all_eips_df = filter_eips(authors_df)
-        eips_per_org = process_organizations(all_eips_df)
-        
-        # Save as text report for all EIPs
-        generate_text_report(eips_per_org, 'Organization', 'Share', 
-                            'EIP Authorship by Organization', 
-                            str(output_dir / "eip_authorship_report.txt"))
-        
-        # Process organizations for accepted EIPs
-        accepted_eips_df = filter_eips(authors_df, status='Final')
-        accepted_eips_per_org = process_organizations(accepted_eips_df)
+        # Save results to CSV first so a failing report can't lose them
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Domain', 'Nakamoto_Coefficient'])
+            writer.writerows(results.items())
         
-        # Save as text report for accepted EIPs
+        # Save text reports for all and accepted EIPs
+        generate_text_report(eips_per_org, 'Organization', 'Share',
+                             'EIP Authorship by Organization',
+                             str(output_dir / "eip_authorship_report.txt"))
         generate_text_report(accepted_eips_per_org, 'Organization', 'Share',
-                            'Accepted EIP Authorship by Organization',
-                            str(output_dir / "accepted_eip_authorship_report.txt"))
+                             'Accepted EIP Authorship by Organization',
+                             str(output_dir / "accepted_eip_authorship_report.txt"))
         
         # Generate report for authors without organizations
-        find_authors_without_orgs(authors_df, str(output_dir / "authors_without_orgs.txt"))
-        
-        # Try matplotlib visualization for all EIPs
-        try:
-            plot_path = output_dir / "eip_authorship.png"
-            plot_entity_shares(eips_per_org, 'Organization', 'Share', 
-                              'EIP Authorship by Organization', str(plot_path))
-        except Exception as e:
-            print(f"Could not create EIP authorship visualization: {e}")
-            
-        # Try matplotlib visualization for accepted EIPs
-        try:
-            plot_path = output_dir / "accepted_eip_authorship.png"
-            plot_entity_shares(accepted_eips_per_org, 'Organization', 'Share',
-                              'Accepted EIP Authorship by Organization', str(plot_path))
-        except Exception as e:
-            print(f"Could not create accepted EIP authorship visualization: {e}")
-    
-    # Save results to CSV if output path provided
-    if output_path:
-        output_dir = Path(output_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Domain', 'Nakamoto_Coefficient'])
-            for domain, coef in results.items():
-                writer.writerow([domain, coef])
+        find_authors_without_orgs(eips_df, str(output_dir / "authors_without_orgs.txt"))
+        
+        # Try matplotlib visualizations for all and accepted EIPs
+        if plots:
+            try:
+                plot_entity_shares(eips_per_org, 'Organization', 'Share',
+                                   'EIP Authorship by Organization',
+                                   str(output_dir / "eip_authorship.png"))
+            except Exception as e:
+                print(f"Could not create EIP authorship visualization: {e}")
+            try:
+                plot_entity_shares(accepted_eips_per_org, 'Organization', 'Share',
+                                   'Accepted EIP Authorship by Organization',
+                                   str(output_dir / "accepted_eip_authorship.png"))
+            except Exception as e:
+                print(f"Could not create accepted EIP authorship visualization: {e}")
+        else:
+            print("Skipping visualization as requested")
     
     return results
 
@@ -487,12 +695,9 @@ def generate_text_report(df: pd.DataFrame, entity_col: str, share_col: str,
         output_path: Path to save the report
     """
     try:
-        # Sort by share descending
-        df_sorted = df.sort_values(by=share_col, ascending=False)
-        
-        # Get top 15 entities
-        top_n = min(100000, len(df_sorted))
-        report_df = df_sorted.head(top_n)
+        # Rank entities by share (report covers up to 100000 entities)
+        report_df = top_by_share(df, share_col, 100000)
+        cumulative_share = np.cumsum(report_df[share_col].to_numpy())
         
         # Create text report
         lines = [
@@ -507,48 +712,41 @@ def generate_text_report(df: pd.DataFrame, entity_col: str, share_col: str,
             ""
         ]
         
-        # Calculate max width for entity names
-        max_name_width = max(len(str(e)) for e in report_df[entity_col])
+        # Calculate max width for entity names, converting names to strings once
+        names = report_df[entity_col].map(str)
+        max_name_width = int(names.str.len().max())
         max_name_width = min(max_name_width, 30)  # Cap at 30 chars
         
         # Add header
         lines.append(f"{'Rank':<4} | {entity_col:<{max_name_width}} | {'Share':>6} | {'Cumulative':>10} | {'Bar'}")
         lines.append("-" * (4 + 3 + max_name_width + 3 + 6 + 3 + 10 + 3 + 20))
         
-        # Add rows
-        cumulative = 0
-        for i, (_, row) in enumerate(report_df.iterrows(), 1):
-            entity = str(row[entity_col])
-            if len(entity) > max_name_width:
-                entity = entity[:max_name_width-3] + "..."
-                
-            share = row[share_col]
-            cumulative += share
-            
-            # Create bar
-            bar_length = int(share * 40)
-            bar = "█" * bar_length
-            
-            lines.append(f"{i:<4} | {entity:<{max_name_width}} | {share:>6.2f} | {cumulative:>10.2f} | {bar}")
+        # Add rows from column arrays rather than boxing every cell via iterrows
+        entities = [
+            entity if len(entity) <= max_name_width else entity[:max_name_width-3] + "..."
+            for entity in names
+        ]
+        shares = report_df[share_col].to_numpy(dtype=float)
+        bar_lengths = (shares * 40).astype(int)
+        lines.extend(
+            f"{i:<4} | {entity:<{max_name_width}} | {share:>6.2f} | {cumulative:>10.2f} | {FULL_BAR[:bar_length]}"
+            for i, (entity, share, cumulative, bar_length) in enumerate(
+                zip(entities, shares.tolist(), cumulative_share.tolist(), bar_lengths.tolist()), 1)
+        )
         
         # Add Nakamoto coefficient
-        nakamoto = 0
-        cum_share = 0
-        for share in report_df[share_col]:
-            cum_share += share
-            nakamoto += 1
-            if cum_share > 0.5:
-                break
-                
+        nakamoto = count_entities_to_threshold(cumulative_share, 0.5, strict=True)
+        
         lines.extend([
             "",
             f"Nakamoto Coefficient: {nakamoto}",
             f"(Minimum entities needed to exceed 50% share: {nakamoto})"
         ])
         
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.write("\n".join(lines))
+        # Write to file, streaming lines instead of joining one large string
+        with open(output_path, 'w', buffering=1 << 20) as f:
+            f.write(lines[0])
+            f.writelines(f"\n{line}" for line in lines[1:])
             
         print(f"Text report saved to {output_path}")
     except Exception as e:
@@ -563,26 +761,16 @@ def main() -> None:
     parser.add_argument('--no-plots', action='store_true', help='Skip generating visualizations')
     args = parser.parse_args()
     
-    # If no-plots is specified, temporarily modify plot_entity_shares to do nothing
-    if args.no_plots:
-        global plot_entity_shares
-        original_plot_function = plot_entity_shares
-        
-        def noop_plot(*args, **kwargs):
-            print("Skipping visualization as requested")
-        
-        plot_entity_shares = noop_plot
-    
     # try:
     results = compute_all_metrics(
         authors_path=args.input,
-        output_path=args.output
+        output_path=args.output,
+        plots=not args.no_plots
     )
     
-    # Print results to console
-    print("\nNakamoto Coefficients:")
-    for domain, coef in results.items():
-        print(f"  {domain.replace('_', ' ')}: {coef}")
+    # Print results to console in a single write
+    print("\nNakamoto Coefficients:\n" + "\n".join(
+        f"  {domain.replace('_', ' ')}: {coef}" for domain, coef in results.items()))
     
     # except Exception as e:
     #     print(f"Error during analysis: {e}")
@@ -597,10 +785,6 @@ def main() -> None:
     #             for domain, coef in results.items():
     #                 writer.writerow([domain, coef])
     #         print(f"Partial results written to {args.output}")
-    
-    # Restore original plot function if we replaced it
-    if args.no_plots:
-        plot_entity_shares = original_plot_function
 
 
 if __name__ == '__main__':
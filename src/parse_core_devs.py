@@ -5,32 +5,175 @@ Parse Core Dev Meeting Attendance - Extract participant information from Ethereu
 
 import os
 import re
+import mmap
 import csv
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Set, Tuple
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib
+    orjson = None
 
-@dataclass
+
+# Patterns used per meeting file and per attendee, compiled once at import
+MEETING_NUMBER_PATTERN = re.compile(r'(?:meeting|call).*?(\d+)', re.IGNORECASE)
+# Attendee sections under a heading (# Attendees, ## Attendees, ### Attendees)
+ATTENDEE_SECTION_PATTERN = re.compile(
+    r'(?:^|\n)#{1,3}\s+Attendees\s*\n+?(.*?)(?=\n#{1,3}|\n----|\n\n\n|\Z)', 
+    re.DOTALL
+)
+# Bullet items (- or *) with optional diamond symbol: GitHub-linked name with org,
+# GitHub-linked name without org, or a plain name
+BULLET_ITEM_PATTERN = re.compile(
+    r'[-*]\s+(?:♦\s+)?(?:\[([^\]]+?)(?:\s+)?\(([^)]+)\)?\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)|([^\n]+))'
+)
+# Section labels that show up as bullet items but aren't attendees
+EXCLUDED_BULLET_NAMES = frozenset(['agenda', 'summary', 'actions', 'notes'])
+BULLET_MARKER_PATTERN = re.compile(r'[-*]')
+# "Attendees: person1, person2, ..." format
+ATTENDEE_LINE_PATTERN = re.compile(
+    r'(?:^|\n)(?:Attendees|Participants):\s*(.*?)(?:\n\n|\n#{1,3}|\Z)', re.DOTALL
+)
+# Simple # Attendees heading followed by a bullet list
+FALLBACK_SECTION_PATTERN = re.compile(r'(?:^|\n)#{1,3}\s+Attendees\s*\n+?((?:[-*]\s+[^\n]+\n?)+)')
+ATTENDEE_ORG_PATTERN = re.compile(r'(.+?)(?:\s+)?\(([^)]+)\)')
+PAREN_ORG_PATTERN = re.compile(r'(?:\s+)?\([^)]+\)')
+GITHUB_HANDLE_PATTERN = re.compile(r'@([\w-]+)')
+
+# Case-sensitive file name fragments that mark a meeting note
+MEETING_FILE_KEYWORDS = ('Call', 'call', 'Meeting', 'meeting')
+
+
+@dataclass(slots=True)
 class MeetingData:
     """Data model for core dev meeting information."""
     meeting_number: int
-    attendees: List[str]
+    attendees: List[Tuple[str, str]]  # (name, organization given inline or '')
     file_path: str
 
 def load_organization_mapping(mapping_file: str) -> Dict:
-    """Load organization mapping from JSON file."""
+    """Load organization mapping from JSON file, with lowercased keys for case-insensitive lookup."""
     try:
-        with open(mapping_file, 'r') as f:
-            return json.load(f)
+        if orjson is not None:
+            with open(mapping_file, 'rb') as f:
+                mapping = orjson.loads(f.read())
+        else:
+            with open(mapping_file, 'r') as f:
+                mapping = json.load(f)
+        return {k.lower(): v for k, v in mapping.items()}
     except Exception as e:
         print(f"Error loading organization mapping: {e}")
         return {}
 
+def read_meeting_notes(file_path: Path) -> str:
+    """
+    Read a meeting notes file, decoding straight from a read-only memory map.
+    
+    Args:
+        file_path: Path to the meeting notes markdown file
+        
+    Returns:
+        File content with newlines normalized as in text mode
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files can't be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Decode from the mapping's buffer without an intermediate bytes copy
+            content = str(mm, 'utf-8')
+    
+    # Normalize newlines as text-mode open() does, since the patterns match on '\n'
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return content
+
+def normalize_attendee(attendee: str) -> Tuple[str, str]:
+    """
+    Split a raw attendee entry into its name and inline organization.
+    
+    Args:
+        attendee: Attendee name, possibly with organization in parentheses
+        
+    Returns:
+        Tuple of (name without parenthesized organizations, organization or '')
+    """
+    org_match = ATTENDEE_ORG_PATTERN.search(attendee)
+    organization = org_match.group(2).strip() if org_match else ''
+    name = PAREN_ORG_PATTERN.sub('', attendee).strip().rstrip(',')
+    
+    return name, organization
+
+def extract_bullet_names(text: str, attendees: Set[str]) -> None:
+    """
+    Add the names from a bullet list of attendees to a set.
+    
+    Args:
+        text: Bullet list text (- or * items, optionally GitHub-linked)
+        attendees: Set of attendee names to update
+    """
+    # Updated pattern to handle GitHub-linked names with handle in URL
+    for item in BULLET_ITEM_PATTERN.finditer(text):
+        # Check if it's a GitHub-linked name with org (group 1), 
+        # GitHub-linked name without org (group 3), or regular name (group 4)
+        name = item.group(1) or item.group(3) or item.group(4)
+        if name and name.lower() not in EXCLUDED_BULLET_NAMES:
+            # Strip trailing commas and asterisks from names
+            attendees.add(name.strip().rstrip(',*'))
+
+def find_scan_start(content: str, keyword_pos: int) -> int:
+    """
+    Find where to start scanning for an attendee pattern anchored on a keyword.
+    
+    The attendee patterns start at a newline (or the start of the notes) followed
+    only by '#' and whitespace before their keyword, so no match can begin before
+    the run of those characters that precedes the keyword's first occurrence.
+    
+    Args:
+        content: Meeting notes text
+        keyword_pos: Position of the keyword's first occurrence, or -1
+        
+    Returns:
+        Position to start searching from, or -1 if the keyword doesn't occur
+    """
+    start = keyword_pos
+    while start > 0 and (content[start - 1] == '#' or content[start - 1].isspace()):
+        start -= 1
+    
+    return start
+
+def find_attendee_anchors(content: str) -> Tuple[int, int]:
+    """
+    Locate the first place the heading and "Attendees:" line patterns could match.
+    
+    "Attendees:" can't occur before the first "Attendees", so its search resumes
+    from there rather than rescanning the notes from the start.
+    
+    Args:
+        content: Meeting notes text
+        
+    Returns:
+        Tuple of (heading pattern start, "Attendees:"/"Participants:" pattern start),
+        each -1 if its keywords don't occur
+    """
+    heading_pos = content.find('Attendees')
+    positions = [
+        pos for pos in (
+            content.find('Attendees:', heading_pos) if heading_pos != -1 else -1,
+            content.find('Participants:'),
+        ) if pos != -1
+    ]
+    line_pos = min(positions) if positions else -1
+    
+    return find_scan_start(content, heading_pos), find_scan_start(content, line_pos)
+
 def extract_meeting_attendees(file_path: Path) -> MeetingData:
     """
     Extract attendance information from a core dev meeting notes file.
@@ -42,110 +185,67 @@ def extract_meeting_attendees(file_path: Path) -> MeetingData:
         MeetingData object with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_meeting_notes(file_path)
         
         # Extract meeting number from filename or content
-        meeting_num_match = re.search(r'(?:meeting|call).*?(\d+)', str(file_path), re.IGNORECASE)
+        meeting_num_match = MEETING_NUMBER_PATTERN.search(str(file_path))
         if meeting_num_match:
             meeting_number = int(meeting_num_match.group(1))
         else:
             meeting_number = 0
-            
-        # Extract date from content
-        date_match = re.search(r'Date: (\d{4}-\d{2}-\d{2})', content)
-        if date_match:
-            date = date_match.group(1)
-        else:
-            # Try alternative date formats
-            alt_date_match = re.search(r'(\d{1,2}(?:st|nd|rd|th)? \w+ \d{4})', content)
-            if alt_date_match:
-                date = alt_date_match.group(1)
-            else:
-                date = "Unknown"
+        
+        # Skip straight to the first place each pattern could match (a cheap
+        # substring search) instead of regex-scanning the whole notes
+        heading_start, line_start = find_attendee_anchors(content)
+        
+        # Notes without any attendee keyword (e.g. agenda-only files) need no regex work
+        if heading_start == -1 and line_start == -1:
+            return MeetingData(meeting_number=meeting_number, attendees=[], file_path=str(file_path))
         
         # Extract attendees - look for common patterns in meeting notes
         attendees: Set[str] = set()
         
         # Pattern 1: Find attendee sections with a heading (# Attendees, ## Attendees, ### Attendees)
         # Improved pattern with more flexible section termination
-        attendee_sections = re.finditer(
-            r'(?:^|\n)#{1,3}\s+Attendees\s*\n+?(.*?)(?=\n#{1,3}|\n----|\n\n\n|\Z)', 
-            content, 
-            re.DOTALL
+        attendee_sections = (
+            ATTENDEE_SECTION_PATTERN.finditer(content, heading_start) if heading_start != -1 else ()
         )
         
         for section in attendee_sections:
             section_text = section.group(1).strip()
             
             # Handle bullet point lists (- or *) with optional diamond symbol
-            # Updated pattern to handle GitHub-linked names with handle in URL
-            bullet_items = re.finditer(
-                r'[-*]\s+(?:♦\s+)?(?:\[([^\]]+?)(?:\s+)?\(([^)]+)\)?\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)|([^\n]+))', 
-                section_text
-            )
-            for item in bullet_items:
-                # Check if it's a GitHub-linked name with org (group 1), 
-                # GitHub-linked name without org (group 3), or regular name (group 4)
-                name = item.group(1) or item.group(3) or item.group(4)
-                if name and name.lower() not in ['agenda', 'summary', 'actions', 'notes']:
-                    # Strip trailing commas and asterisks from names
-                    name = name.strip().rstrip(',*')
-                    attendees.add(name)
+            extract_bullet_names(section_text, attendees)
             
-            # If no bullet points, check for comma-separated list
-            if not re.search(r'[-*]', section_text):
-                # First check if it's just a list of names on separate lines (no commas)
-                lines = [line.strip() for line in section_text.split('\n') if line.strip()]
-                if lines:
-                    # If there are commas in any line, treat as comma-separated
-                    if any(',' in line for line in lines):
-                        for line in lines:
-                            for name in line.split(','):
-                                name = name.strip().rstrip(',*')
-                                if name and len(name) > 1:
-                                    attendees.add(name)
-                    # Otherwise treat each line as a separate name
-                    else:
-                        for name in lines:
-                            name = name.strip().rstrip(',*')
-                            if name and len(name) > 1:
-                                attendees.add(name)
+            # If no bullet points, treat it as a list of names separated by
+            # commas and/or newlines (the text has no '*' left to strip)
+            if not BULLET_MARKER_PATTERN.search(section_text):
+                for name in section_text.replace('\n', ',').split(','):
+                    name = name.strip()
+                    if len(name) > 1:
+                        attendees.add(name)
         
         # Pattern 2: "Attendees: person1, person2, ..." format
-        attendees_match = re.search(r'(?:^|\n)(?:Attendees|Participants):\s*(.*?)(?:\n\n|\n#{1,3}|\Z)', content, re.DOTALL)
+        attendees_match = ATTENDEE_LINE_PATTERN.search(content, line_start) if line_start != -1 else None
         if attendees_match:
             attendee_text = attendees_match.group(1).strip()
-            # Split by newlines and commas
-            for line in attendee_text.split('\n'):
-                for name in line.split(','):
-                    name = name.strip().rstrip(',*')
-                    if name and not name.startswith('-') and len(name) > 1:
-                        attendees.add(name)
+            # Split by newlines and commas in a single pass
+            for name in attendee_text.replace('\n', ',').split(','):
+                name = name.strip().rstrip('*')
+                if not name.startswith('-') and len(name) > 1:
+                    attendees.add(name)
         
         # Fallback pattern: Handle simple # Attendees followed by bullet lists
         # that might not be caught by the main pattern
-        fallback_match = re.search(r'(?:^|\n)#{1,3}\s+Attendees\s*\n+?((?:[-*]\s+[^\n]+\n?)+)', content)
+        fallback_match = FALLBACK_SECTION_PATTERN.search(content, heading_start) if heading_start != -1 else None
         if fallback_match:
-            bullet_text = fallback_match.group(1).strip()
-            # Updated pattern to handle GitHub-linked names with handle in URL
-            bullet_items = re.finditer(
-                r'[-*]\s+(?:♦\s+)?(?:\[([^\]]+?)(?:\s+)?\(([^)]+)\)?\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)|([^\n]+))', 
-                bullet_text
-            )
-            for item in bullet_items:
-                # Check if it's a GitHub-linked name with org (group 1), 
-                # GitHub-linked name without org (group 3), or regular name (group 4)
-                name = item.group(1) or item.group(3) or item.group(4)
-                if name and name.lower() not in ['agenda', 'summary', 'actions', 'notes']:
-                    # Strip trailing commas and asterisks from names
-                    name = name.strip().rstrip(',*')
-                    attendees.add(name)
+            extract_bullet_names(fallback_match.group(1).strip(), attendees)
         
-        # Return the extracted data
+        # Return the extracted data, deduplicating attendees on their normalized
+        # form so "Alice (EF)" and "Alice(EF)" from different patterns count once
         return MeetingData(
             meeting_number=meeting_number,
-            attendees=list(attendees),
+            attendees=list({normalize_attendee(attendee) for attendee in attendees}),
             file_path=str(file_path)
         )
     except Exception as e:
@@ -159,36 +259,101 @@ def map_attendee_to_organizations(attendee: str, org_mapping: Dict) -> List[str]
     
     Args:
         attendee: Attendee name, possibly with organization
+        org_mapping: Organization mapping with lowercased keys (see load_organization_mapping)
         
     Returns:
         List of organization names
     """
-    # First check if organization is in parentheses (with or without space)
-    org_match = re.search(r'(.+?)(?:\s+)?\(([^)]+)\)', attendee)
-    if org_match:
-        return [org_match.group(2).strip()]
+    # Names from normalize_attendee are already free of parentheses, so the
+    # organization regexes only need to run on raw entries
+    if '(' in attendee:
+        # First check if organization is in parentheses (with or without space)
+        org_match = ATTENDEE_ORG_PATTERN.search(attendee)
+        if org_match:
+            return [org_match.group(2).strip()]
+        
+        attendee = PAREN_ORG_PATTERN.sub('', attendee)
     
-    # Clean the attendee name - remove org, trailing commas, and asterisks
-    clean_name = re.sub(r'(?:\s+)?\([^)]+\)', '', attendee).strip().rstrip(',*')
+    # Clean the attendee name - remove trailing commas and asterisks
+    clean_name = attendee.strip().rstrip(',*')
     
     # Try to find organizations by name (case-insensitive)
     orgs = set()
-    # Create a case-insensitive mapping
-    case_insensitive_mapping = {k.lower(): v for k, v in org_mapping.items()}
     
-    if clean_name.lower() in case_insensitive_mapping:
-        orgs.update(case_insensitive_mapping[clean_name.lower()])
+    if clean_name.lower() in org_mapping:
+        orgs.update(org_mapping[clean_name.lower()])
     
     # Try to find organizations by GitHub handle if present (case-insensitive)
-    github_match = re.search(r'@([\w-]+)', clean_name)
+    github_match = GITHUB_HANDLE_PATTERN.search(clean_name) if '@' in clean_name else None
     if github_match:
         github_handle = github_match.group(1).lower()
-        if github_handle in case_insensitive_mapping:
-            orgs.update(case_insensitive_mapping[github_handle])
+        if github_handle in org_mapping:
+            orgs.update(org_mapping[github_handle])
     
     return list(orgs)
 
 
+def attendance_rows(meeting_data_list: List[MeetingData], org_mapping: Dict) -> Iterator[Tuple]:
+    """
+    Generate attendance CSV rows, one per meeting attendee.
+    
+    Args:
+        meeting_data_list: Parsed meetings
+        org_mapping: Organization mapping with lowercased keys
+        
+    Yields:
+        Tuples of (meeting number, attendee, organizations, filename)
+    """
+    # Core devs attend many meetings, so resolve each name against the mapping once
+    resolved_names: Dict[str, str] = {}
+    
+    for meeting in meeting_data_list:
+        for name, organization in meeting.attendees:
+            # An organization given inline takes precedence over the mapping
+            if organization:
+                organizations = organization
+            else:
+                organizations = resolved_names.get(name)
+                if organizations is None:
+                    organizations = '; '.join(map_attendee_to_organizations(name, org_mapping))
+                    resolved_names[name] = organizations
+            
+            yield (
+                meeting.meeting_number,
+                name,
+                organizations,
+                meeting.file_path
+            )
+
+
+def find_meeting_files(repo_path: Path) -> List[Path]:
+    """
+    Find meeting note files below any AllCoreDevs* directory of the repository.
+    
+    Walks the tree once, so a file whose name matches several of the
+    MEETING_FILE_KEYWORDS is only returned (and parsed) once.
+    
+    Args:
+        repo_path: Path to the Ethereum PM repository
+        
+    Returns:
+        Sorted list of meeting note paths
+    """
+    meeting_files = []
+    
+    for dirpath, _, filenames in os.walk(repo_path):
+        # Only directories at or below an AllCoreDevs* directory hold meeting notes
+        relative_dir = os.path.relpath(dirpath, repo_path)
+        if not any(part.startswith('AllCoreDevs') for part in relative_dir.split(os.sep)):
+            continue
+        
+        for filename in filenames:
+            if filename.endswith('.md') and any(keyword in filename[:-3] for keyword in MEETING_FILE_KEYWORDS):
+                meeting_files.append(Path(dirpath, filename))
+    
+    return sorted(meeting_files)
+
+
 def process_core_dev_meetings(repo_path: str, output_path: str, org_mapping_file: str) -> None:
     """
     Process all core dev meeting notes and generate attendance CSV.
@@ -201,26 +366,17 @@ def process_core_dev_meetings(repo_path: str, output_path: str, org_mapping_file
     # Load organization mapping
     org_mapping = load_organization_mapping(org_mapping_file)
     
-    repo_path = Path(repo_path)
-    
-    # Define common patterns for AllCoreDevs files
-    patterns = [
-        "AllCoreDevs*/**/*Call*",
-        "AllCoreDevs*/**/*call*", 
-        "AllCoreDevs*/**/*Meeting*",
-        "AllCoreDevs*/**/*meeting*",
-    ]
     # Find all meeting notes
-    meeting_files = []
-    for pattern in patterns:
-        meeting_files.extend(list(repo_path.glob(f"**/{pattern}.md")))
+    meeting_files = find_meeting_files(Path(repo_path))
     
-    # Process each file
+    # Process files in parallel; each file is parsed independently and
+    # map keeps results in file order
     meeting_data_list = []
-    for file_path in tqdm(meeting_files, desc="Processing meeting notes"):
-        meeting_data = extract_meeting_attendees(file_path)
-        if meeting_data.meeting_number > 0:
-            meeting_data_list.append(meeting_data)
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(extract_meeting_attendees, meeting_files, chunksize=32)
+        for meeting_data in tqdm(results, total=len(meeting_files), desc="Processing meeting notes"):
+            if meeting_data.meeting_number > 0:
+                meeting_data_list.append(meeting_data)
     
     print(f"Successfully processed {len(meeting_data_list)} core dev meetings")
     
@@ -229,22 +385,11 @@ def process_core_dev_meetings(repo_path: str, output_path: str, org_mapping_file
     os.makedirs(output_dir, exist_ok=True)
     
     # Write meeting attendance to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['Meeting Number', 'Attendee', 'Organizations', 'Filename'])
         
-        for meeting in meeting_data_list:
-            for attendee in meeting.attendees:
-                organizations = map_attendee_to_organizations(attendee, org_mapping)
-                # Remove organization from attendee name if it's in the name
-                clean_attendee = re.sub(r'(?:\s+)?\([^)]+\)', '', attendee).strip().rstrip(',')
-                
-                writer.writerow([
-                    meeting.meeting_number,
-                    clean_attendee,
-                    '; '.join(organizations) if organizations else '',
-                    meeting.file_path
-                ])
+        writer.writerows(attendance_rows(meeting_data_list, org_mapping))
     
     print(f"Core dev meeting attendance data written to {output_path}")
 
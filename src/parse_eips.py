@@ -5,18 +5,45 @@ EIP Parser - Extract author information from Ethereum Improvement Proposals
 
 import os
 import re
+import sys
 import csv
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Optional, Set, Union
 from dataclasses import dataclass
+from datetime import date
 import yaml
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml bindings are an optional speedup; fall back to the pure-Python loader
+    from yaml import SafeLoader as YamlLoader
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib
+    orjson = None
+
+
+# Patterns used per EIP file and per author entry, compiled once at import
+EIP_NUMBER_PATTERN = re.compile(r'eip-(\d+)')
+# Email must contain a dot to distinguish it from a GitHub handle in angle brackets
+EMAIL_PATTERN = re.compile(r'<([^>]*\.[^>]*)>')
+GITHUB_HANDLE_PATTERN = re.compile(r'@([\w-]+)')
+ORGANIZATION_PATTERN = re.compile(r'\(([^)]*)\)')
+# A frontmatter line the fast path handles: a simple key, ": " and a one-line value
+FRONTMATTER_LINE_PATTERN = re.compile(r'([A-Za-z0-9_-]+): +([^ ].*)')
+# Characters that give a YAML value a special meaning when they start it
+YAML_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+YAML_STR_TAG = 'tag:yaml.org,2002:str'
+YAML_INT_TAG = 'tag:yaml.org,2002:int'
+YAML_TIMESTAMP_TAG = 'tag:yaml.org,2002:timestamp'
+
+
+@dataclass(slots=True)
 class EipAuthor:
     """Represents an author of an Ethereum Improvement Proposal."""
     name: str
@@ -27,6 +54,8 @@ class EipAuthor:
 
 class EipMetadata:
     """Metadata for an Ethereum Improvement Proposal."""
+    __slots__ = ('eip_number', 'title', 'authors', 'status', 'type', 'category', 'created')
+    
     def __init__(self, eip_number: int, title: str, authors: List[EipAuthor], 
                  status: str, type_: str, category: Optional[str], 
                  created: str):
@@ -39,6 +68,187 @@ class EipMetadata:
         self.created = created
 
 
+def yaml_scalar_tag(value: str) -> str:
+    """
+    Resolve the tag YAML implicitly gives a non-empty plain scalar.
+    
+    Args:
+        value: Plain scalar text
+        
+    Returns:
+        YAML tag (e.g. YAML_STR_TAG for strings)
+    """
+    for tag, regexp in YamlLoader.yaml_implicit_resolvers.get(value[0], ()):
+        if regexp.match(value):
+            return tag
+    return YAML_STR_TAG
+
+
+def parse_simple_frontmatter(text: str) -> Optional[Dict]:
+    """
+    Parse frontmatter made only of "key: value" lines without running YAML.
+    
+    EIP headers are flat mappings of one-line values, which this handles in a
+    single pass over the lines. Anything YAML could read differently (quoting,
+    comments, multi-line values, non-string values other than plain integers
+    and dates, ...) is rejected so that the caller can fall back to YAML.
+    
+    Args:
+        text: Frontmatter between the "---" lines
+        
+    Returns:
+        Dictionary equal to what the YAML loader would produce, or None if the
+        frontmatter needs the YAML loader
+    """
+    fields = {}
+    
+    for line in text.split('\n'):
+        if not line:
+            continue
+        line_match = FRONTMATTER_LINE_PATTERN.fullmatch(line)
+        if not line_match:
+            return None
+        key, value = line_match.groups()
+        value = value.rstrip(' ')
+        
+        # Keys YAML wouldn't read as strings, and values that aren't a plain
+        # one-line scalar, need YAML
+        if (yaml_scalar_tag(key) != YAML_STR_TAG or value[0] in YAML_INDICATORS
+                or ': ' in value or ' #' in value or value.endswith(':')
+                or not value.isprintable()):
+            return None
+        
+        # Resolve the value's type the way the YAML loader would
+        tag = yaml_scalar_tag(value)
+        if tag == YAML_STR_TAG:
+            fields[key] = value
+        elif tag == YAML_INT_TAG and value.isdecimal() and value.isascii() and (
+                value == '0' or not value.startswith('0')):
+            fields[key] = int(value)
+        elif tag == YAML_TIMESTAMP_TAG and len(value) == 10:
+            try:
+                fields[key] = date.fromisoformat(value)
+            except ValueError:
+                return None
+        else:
+            return None
+    
+    # An empty frontmatter isn't a mapping at all
+    return fields or None
+
+
+def parse_author(author_entry: str) -> EipAuthor:
+    """
+    Parse one author entry into its name, email, GitHub handle and organization.
+    
+    Most entries carry only one of the optional parts, so each regex pass is
+    skipped unless its opening character is present in what is left.
+    
+    Args:
+        author_entry: Author entry, e.g. "Name <email> (@handle) (Organization)"
+        
+    Returns:
+        EipAuthor for the entry
+    """
+    name = author_entry
+    email = None
+    github = None
+    organization = None
+    
+    # Extract email if present (must contain a dot to distinguish from GitHub handles)
+    email_match = EMAIL_PATTERN.search(name) if '<' in name else None
+    if email_match:
+        email = email_match.group(1)
+        name = name.replace(email_match.group(0), '').strip()
+        
+    # Extract GitHub handle if present
+    github_match = GITHUB_HANDLE_PATTERN.search(name) if '@' in name else None
+    if github_match:
+        github = github_match.group(1)
+        name = name.replace(github_match.group(0), '').strip()
+        
+    # Extract organization if in parentheses
+    org_match = ORGANIZATION_PATTERN.search(name) if '(' in name else None
+    if org_match:
+        org_content = org_match.group(1)
+        # Only set organization if parentheses aren't empty. The same few
+        # organizations recur across EIPs, so share one string object per name
+        if org_content.strip():
+            organization = sys.intern(org_content)
+        name = name.replace(org_match.group(0), '').strip()
+        
+    return EipAuthor(name=name, email=email, github=github, organization=organization)
+
+
+def parse_authors(authors_raw) -> List[EipAuthor]:
+    """
+    Parse the author field of an EIP's frontmatter.
+    
+    Args:
+        authors_raw: Comma-separated author string or list of author entries
+        
+    Returns:
+        List of EipAuthor objects, in field order
+    """
+    # Split authors by comma if it's a string
+    if isinstance(authors_raw, str):
+        return [parse_author(a.strip()) for a in authors_raw.split(',')]
+    elif isinstance(authors_raw, list):
+        return [parse_author(a) for a in authors_raw]
+    return []
+
+
+def parse_eip_content(content: Union[str, bytes], eip_number: int) -> Optional[EipMetadata]:
+    """
+    Parse the metadata of an EIP held in memory.
+    
+    Args:
+        content: EIP markdown, as text or UTF-8 bytes
+        eip_number: EIP number (parse_eip_file takes it from the filename)
+        
+    Returns:
+        EipMetadata object or None if the content has no frontmatter
+        
+    Raises:
+        Exception: If the content can't be decoded or its frontmatter can't be parsed
+    """
+    if isinstance(content, bytes):
+        # Decode and normalize newlines as text-mode open() does
+        content = content.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Extract YAML frontmatter: it must open the file, and ends at the first
+    # "---" that begins a later line
+    if not content.startswith('---\n'):
+        return None
+    frontmatter_end = content.find('\n---', 4)
+    if frontmatter_end == -1:
+        return None
+        
+    # Most headers are plain "key: value" lines; only the rest need YAML
+    frontmatter_text = content[4:frontmatter_end]
+    frontmatter = parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is None:
+        # libyaml accepts tabs in plain scalars and flow collections where the
+        # pure-Python SafeLoader raises, so frontmatter with tabs keeps to SafeLoader
+        loader = yaml.SafeLoader if '\t' in frontmatter_text else YamlLoader
+        frontmatter = yaml.load(frontmatter_text, Loader=loader)
+    
+    # Extract authors
+    authors = parse_authors(frontmatter.get('author', ''))
+        
+    return EipMetadata(
+        eip_number=eip_number,
+        title=frontmatter.get('title', ''),
+        authors=authors,
+        status=frontmatter.get('status', ''),
+        type_=frontmatter.get('type', ''),
+        category=frontmatter.get('category', None),
+        created=frontmatter.get('created', '')
+    )
+
+
 def parse_eip_file(file_path: Path) -> Optional[EipMetadata]:
     """
     Parse an EIP markdown file and extract its metadata.
@@ -50,74 +260,28 @@ def parse_eip_file(file_path: Path) -> Optional[EipMetadata]:
         EipMetadata object or None if parsing failed
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Extract YAML frontmatter
-        yaml_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if not yaml_match:
-            return None
-            
-        frontmatter = yaml.safe_load(yaml_match.group(1))
-        
-        # Extract EIP number from filename
-        eip_number_match = re.search(r'eip-(\d+)', file_path.name)
+        # Extract EIP number from filename first, so other markdown files are
+        # rejected without being read
+        eip_number_match = EIP_NUMBER_PATTERN.search(file_path.name)
         if eip_number_match:
             eip_number = int(eip_number_match.group(1))
         else:
             return None
-            
-        # Extract authors
-        authors_raw = frontmatter.get('author', '')
-        authors = []
-        
-        # Split authors by comma if it's a string
-        if isinstance(authors_raw, str):
-            author_entries = [a.strip() for a in authors_raw.split(',')]
-        elif isinstance(authors_raw, list):
-            author_entries = authors_raw
-        else:
-            author_entries = []
-            
-        for author_entry in author_entries:
-            # Try to parse name, email, github handle, and organization
-            name = author_entry
-            email = None
-            github = None
-            organization = None
-            
-            # Extract email if present (must contain a dot to distinguish from GitHub handles)
-            email_match = re.search(r'<([^>]*\.[^>]*)>', name)
-            if email_match:
-                email = email_match.group(1)
-                name = name.replace(email_match.group(0), '').strip()
-                
-            # Extract GitHub handle if present
-            github_match = re.search(r'@([\w-]+)', name)
-            if github_match:
-                github = github_match.group(1)
-                name = name.replace(github_match.group(0), '').strip()
-                
-            # Extract organization if in parentheses
-            org_match = re.search(r'\(([^)]*)\)', name)
-            if org_match:
-                org_content = org_match.group(1)
-                # Only set organization if parentheses aren't empty
-                if org_content.strip():
-                    organization = org_content
-                name = name.replace(org_match.group(0), '').strip()
-                
-            authors.append(EipAuthor(name=name, email=email, github=github, organization=organization))
-            
-        return EipMetadata(
-            eip_number=eip_number,
-            title=frontmatter.get('title', ''),
-            authors=authors,
-            status=frontmatter.get('status', ''),
-            type_=frontmatter.get('type', ''),
-            category=frontmatter.get('category', None),
-            created=frontmatter.get('created', '')
-        )
+        
+        # Only the frontmatter is parsed, so read line by line up to its closing
+        # "---" instead of reading the whole EIP body
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = [f.readline()]
+            if lines[0] != '---\n':
+                return None
+            for line in f:
+                lines.append(line)
+                # Like the search in parse_eip_content, the line right after the
+                # opening "---" can't close the frontmatter
+                if len(lines) > 2 and line.startswith('---'):
+                    break
+        
+        return parse_eip_content(''.join(lines), eip_number)
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
         return None
@@ -133,8 +297,12 @@ def load_organization_mapping(mapping_file: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping names to list of organizations (case-insensitive keys)
     """
-    with open(mapping_file, 'r') as f:
-        mapping = json.load(f)
+    if orjson is not None:
+        with open(mapping_file, 'rb') as f:
+            mapping = orjson.loads(f.read())
+    else:
+        with open(mapping_file, 'r') as f:
+            mapping = json.load(f)
     
     # Create case-insensitive mapping
     case_insensitive_mapping = {}
@@ -175,6 +343,63 @@ def get_organizations(author: EipAuthor, org_mapping: Dict[str, List[str]]) -> S
     return orgs
 
 
+def author_rows(eip_metadata_list: List[EipMetadata],
+                org_mapping: Dict[str, List[str]]) -> Iterator[Tuple]:
+    """
+    Generate authors CSV rows, one per EIP author.
+    
+    Args:
+        eip_metadata_list: Parsed EIPs
+        org_mapping: Organization mapping dictionary (case-insensitive keys)
+        
+    Yields:
+        Tuples matching the authors CSV header
+    """
+    for metadata in eip_metadata_list:
+        for author in metadata.authors:
+            # Get organizations from mapping and EIP
+            organizations = get_organizations(author, org_mapping)
+            
+            yield (
+                metadata.eip_number,
+                metadata.title,
+                metadata.type,
+                metadata.category or '',
+                metadata.status,
+                metadata.created,
+                author.name,
+                author.email or '',
+                author.github or '',
+                '; '.join(sorted(organizations)) if organizations else ''
+            )
+
+
+def parse_eip_directory(eips_dir: Path) -> List[EipMetadata]:
+    """
+    Parse every EIP markdown file in a directory in parallel.
+    
+    Args:
+        eips_dir: Directory holding eip-*.md files (EIPS/ in the EIPs repository)
+        
+    Returns:
+        List of parsed EipMetadata objects, skipping files that failed to parse
+    """
+    # Find all EIP markdown files
+    eip_files = list(Path(eips_dir).glob('eip-*.md'))
+    print(f"Found {len(eip_files)} EIP files")
+    
+    # Parse files in parallel; each file is parsed independently and
+    # map keeps results in file order
+    eip_metadata_list = []
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(parse_eip_file, eip_files, chunksize=32)
+        for metadata in tqdm(results, total=len(eip_files), desc="Parsing EIPs"):
+            if metadata:
+                eip_metadata_list.append(metadata)
+    
+    return eip_metadata_list
+
+
 def process_eips_repository(repo_path: str, output_path: str, org_mapping_file: str) -> None:
     """
     Process all EIPs in the repository and generate an authors CSV file.
@@ -184,20 +409,10 @@ def process_eips_repository(repo_path: str, output_path: str, org_mapping_file:
         output_path: Path to save the output CSV file
         org_mapping_file: Path to the organization mapping JSON file
     """
-    eips_path = Path(repo_path)
-    
     # Load organization mapping
     org_mapping = load_organization_mapping(org_mapping_file)
     
-    # Find all EIP markdown files
-    eip_files = list(eips_path.glob('EIPS/eip-*.md'))
-    print(f"Found {len(eip_files)} EIP files")
-    
-    eip_metadata_list = []
-    for file_path in tqdm(eip_files, desc="Parsing EIPs"):
-        metadata = parse_eip_file(file_path)
-        if metadata:
-            eip_metadata_list.append(metadata)
+    eip_metadata_list = parse_eip_directory(Path(repo_path) / 'EIPS')
     
     print(f"Successfully parsed {len(eip_metadata_list)} EIPs")
     
@@ -206,28 +421,12 @@ def process_eips_repository(repo_path: str, output_path: str, org_mapping_file:
     os.makedirs(output_dir, exist_ok=True)
     
     # Write results to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['EIP', 'Title', 'Type', 'Category', 'Status', 'Created', 
                          'Author Name', 'Author Email', 'Author GitHub', 'Organizations'])
         
-        for metadata in eip_metadata_list:
-            for author in metadata.authors:
-                # Get organizations from mapping and EIP
-                organizations = get_organizations(author, org_mapping)
-                
-                writer.writerow([
-                    metadata.eip_number,
-                    metadata.title,
-                    metadata.type,
-                    metadata.category or '',
-                    metadata.status,
-                    metadata.created,
-                    author.name,
-                    author.email or '',
-                    author.github or '',
-                    '; '.join(sorted(organizations)) if organizations else ''
-                ])
+        writer.writerows(author_rows(eip_metadata_list, org_mapping))
     
     print(f"EIP author data written to {output_path}")
 
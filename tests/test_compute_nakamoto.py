@@ -9,60 +9,95 @@ import pandas as pd
 import tempfile
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.compute_nakamoto import compute_nakamoto_coefficient, compute_eip_nakamoto
+from src import compute_nakamoto
+from src.compute_nakamoto import (
+    compute_nakamoto_coefficient, compute_nakamoto_coefficients, compute_eip_nakamoto,
+    find_authors_without_orgs, load_author_data, process_organizations
+)
 
 
 class TestNakamotoCoefficient(unittest.TestCase):
     """Test cases for Nakamoto coefficient computations."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the share DataFrames once; the functions under test don't modify them."""
+        entities = ['A', 'B', 'C', 'D', 'E']
+        # Decreasing shares
+        cls.graded_df = pd.DataFrame({'Entity': entities, 'Share': [0.3, 0.25, 0.2, 0.15, 0.1]})
+        # Equal shares
+        cls.equal_df = pd.DataFrame({'Entity': entities, 'Share': [0.2, 0.2, 0.2, 0.2, 0.2]})
+        # One dominant entity
+        cls.concentrated_df = pd.DataFrame({'Entity': entities, 'Share': [0.6, 0.1, 0.1, 0.1, 0.1]})
+        # The largest share is exactly 0.5
+        cls.boundary_df = pd.DataFrame({'Entity': ['A', 'B', 'C', 'D'],
+                                        'Share': [0.25, 0.5, 0.125, 0.125]})
+        # Shares summing to less than 0.5
+        cls.short_df = pd.DataFrame({'Entity': ['A', 'B', 'C'], 'Share': [0.2, 0.1, 0.1]})
+        # No entities
+        cls.empty_df = pd.DataFrame({'Entity': [], 'Share': []})
+
     def test_compute_nakamoto_coefficient_basic(self):
         """Test basic Nakamoto coefficient computation."""
-        # Create a test DataFrame
-        data = {
-            'Entity': ['A', 'B', 'C', 'D', 'E'],
-            'Share': [0.3, 0.25, 0.2, 0.15, 0.1]
-        }
-        df = pd.DataFrame(data)
-        
         # Compute Nakamoto coefficient with threshold 0.5
-        result = compute_nakamoto_coefficient(df, 'Entity', 'Share', 0.5)
+        result = compute_nakamoto_coefficient(self.graded_df, 'Entity', 'Share', 0.5)
         
         # It should take 3 entities (A + B + C = 0.75) to exceed 0.5
         self.assertEqual(result, 3)
         
     def test_compute_nakamoto_coefficient_equal_shares(self):
         """Test Nakamoto coefficient with equal shares."""
-        # Create a test DataFrame with equal shares
-        data = {
-            'Entity': ['A', 'B', 'C', 'D', 'E'],
-            'Share': [0.2, 0.2, 0.2, 0.2, 0.2]
-        }
-        df = pd.DataFrame(data)
-        
         # Compute Nakamoto coefficient with threshold 0.5
-        result = compute_nakamoto_coefficient(df, 'Entity', 'Share', 0.5)
+        result = compute_nakamoto_coefficient(self.equal_df, 'Entity', 'Share', 0.5)
         
         # It should take 3 entities to exceed 0.5
         self.assertEqual(result, 3)
         
     def test_compute_nakamoto_coefficient_high_concentration(self):
         """Test Nakamoto coefficient with high concentration."""
-        # Create a test DataFrame with one dominant entity
-        data = {
-            'Entity': ['A', 'B', 'C', 'D', 'E'],
-            'Share': [0.6, 0.1, 0.1, 0.1, 0.1]
-        }
-        df = pd.DataFrame(data)
-        
         # Compute Nakamoto coefficient with threshold 0.5
-        result = compute_nakamoto_coefficient(df, 'Entity', 'Share', 0.5)
+        result = compute_nakamoto_coefficient(self.concentrated_df, 'Entity', 'Share', 0.5)
         
         # It should take only 1 entity to exceed 0.5
         self.assertEqual(result, 1)
+
+    def test_compute_nakamoto_coefficient_threshold_reached_exactly(self):
+        """Test Nakamoto coefficient when a cumulative share equals the threshold."""
+        # Compute Nakamoto coefficient with threshold 0.5
+        result = compute_nakamoto_coefficient(self.boundary_df, 'Entity', 'Share', 0.5)
+
+        # Reaching the threshold is enough, so B alone counts
+        self.assertEqual(result, 1)
+
+    def test_compute_nakamoto_coefficient_threshold_not_reached(self):
+        """Test Nakamoto coefficient when the shares never reach the threshold."""
+        # Compute Nakamoto coefficient with threshold 0.5
+        result = compute_nakamoto_coefficient(self.short_df, 'Entity', 'Share', 0.5)
+
+        # Every entity is needed
+        self.assertEqual(result, 3)
+
+    def test_compute_nakamoto_coefficient_empty(self):
+        """Test Nakamoto coefficient with no entities."""
+        # Compute Nakamoto coefficient with threshold 0.5
+        result = compute_nakamoto_coefficient(self.empty_df, 'Entity', 'Share', 0.5)
+
+        # No entities, so no entities are needed
+        self.assertEqual(result, 0)
+
+    def test_compute_nakamoto_coefficients_multiple_thresholds(self):
+        """Test Nakamoto coefficients for several thresholds at once."""
+        # Compute Nakamoto coefficients for 1/4, 2/3 and 4/5 control
+        result = compute_nakamoto_coefficients(self.graded_df, 'Entity', 'Share',
+                                               [0.25, 2 / 3, 0.8])
+
+        # A = 0.3 exceeds 1/4, A + B + C = 0.75 exceeds 2/3, A through D = 0.9 exceeds 4/5
+        self.assertEqual(result.tolist(), [1, 3, 4])
         
     def test_compute_eip_nakamoto(self):
         """Test EIP Nakamoto coefficient computation."""
@@ -87,5 +122,120 @@ class TestNakamotoCoefficient(unittest.TestCase):
         self.assertEqual(result, 2)
 
 
+    def test_process_organizations_counts_duplicates_once(self):
+        """Test that repeated author and organization rows count once per EIP."""
+        df = pd.DataFrame({
+            'EIP': [1, 1, 1, 2, 2, 3],
+            'Author Name': ['Alice', 'Bob', 'Bob', 'Carol', 'Carol', 'Dave'],
+            'Organizations': ['Org1', 'Org1; Org2', 'Org1; Org2', None, ' ', 'Org1']
+        })
+        
+        result = process_organizations(df)
+        
+        # Org1 and Org2 once for EIP 1, Carol (no organization) once for EIP 2, Org1 for EIP 3
+        counts = dict(zip(result['Organization'], result['EIP_Count']))
+        self.assertEqual(counts, {'Carol': 1, 'Org1': 2, 'Org2': 1})
+        self.assertAlmostEqual(result['Share'].sum(), 1.0)
+
+
+class TestAuthorsWithoutOrgs(unittest.TestCase):
+    """Test cases for the authors-without-organizations report."""
+
+    def test_find_authors_without_orgs_none_missing(self):
+        """Test the report when every author has an organization."""
+        df = pd.DataFrame({
+            'EIP': [1, 2],
+            'Title': ['Title1', 'Title2'],
+            'Status': ['Final', 'Draft'],
+            'Author Name': ['Alice', 'Bob'],
+            'Author Email': ['alice@org1.com', 'bob@org2.com'],
+            'Author GitHub': ['alice', 'bob'],
+            'Organizations': ['Org1', 'Org2']
+        })
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "authors_without_orgs.txt")
+            find_authors_without_orgs(df, output_path)
+
+            with open(output_path) as f:
+                report = f.read()
+
+        # The report is still written, listing no authors
+        self.assertIn("Total authors without organizations: 0", report)
+        self.assertNotIn("EIP-", report)
+
+
+
+@unittest.skipIf(compute_nakamoto.pyarrow is None, "the Parquet cache needs pyarrow")
+class TestAuthorDataCache(unittest.TestCase):
+    """Test cases for the Parquet cache of load_author_data."""
+
+    CSV_HEADER = "EIP,Title,Category,Status,Author Name,Author Email,Author GitHub,Organizations\n"
+
+    def setUp(self):
+        """Write a small authors CSV to a fresh temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.tmp_dir.name) / "authors.csv"
+        self.cache_path = self.csv_path.with_suffix('.parquet')
+        self.write_csv("1,Title1,Core,Final,Alice,alice@org1.com,alice,Org1\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_csv(self, rows: str) -> None:
+        """Write the authors CSV with the given rows."""
+        self.csv_path.write_text(self.CSV_HEADER + rows)
+
+    def test_load_author_data_cache_hit(self):
+        """Test that a fresh cache is read instead of the CSV."""
+        first = load_author_data(str(self.csv_path))
+        self.assertTrue(self.cache_path.exists())
+        
+        with patch.object(compute_nakamoto.pd, 'read_csv') as read_csv:
+            second = load_author_data(str(self.csv_path))
+        
+        read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_load_author_data_cache_invalidated_by_mtime(self):
+        """Test that a CSV rewritten at the same size is parsed again."""
+        load_author_data(str(self.csv_path))
+        
+        # Same size, with the mtime moved on by a single nanosecond
+        mtime_ns = self.csv_path.stat().st_mtime_ns
+        self.write_csv("2,Title2,Core,Draft,Bobby,bobby@org2.com,bobby,Org2\n")
+        os.utime(self.csv_path, ns=(mtime_ns + 1, mtime_ns + 1))
+        
+        result = load_author_data(str(self.csv_path))
+        
+        self.assertEqual(result['Author Name'].tolist(), ['Bobby'])
+
+    def test_load_author_data_cache_invalidated_by_dtype(self):
+        """Test that a cache whose dtypes don't match AUTHOR_DTYPES is ignored."""
+        load_author_data(str(self.csv_path))
+        
+        # Rewrite the cache with Status as plain strings, keeping its source metadata
+        table = compute_nakamoto.pq.read_table(self.cache_path)
+        stale = table.set_column(table.schema.get_field_index('Status'), 'Status',
+                                 table['Status'].cast(compute_nakamoto.pyarrow.string()))
+        compute_nakamoto.pq.write_table(stale, self.cache_path)
+        
+        result = load_author_data(str(self.csv_path))
+        
+        self.assertEqual(result['Status'].dtype, 'category')
+
+    def test_load_author_data_cache_write_failure(self):
+        """Test that a failed cache write leaves no file and still returns the data."""
+        def write_partial(table, where, **kwargs):
+            Path(where).write_bytes(b'PAR1')
+            raise PermissionError("read-only directory")
+        
+        with patch.object(compute_nakamoto.pq, 'write_table', write_partial):
+            result = load_author_data(str(self.csv_path))
+        
+        self.assertEqual(result['Author Name'].tolist(), ['Alice'])
+        self.assertFalse(self.cache_path.exists())
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the core dev meeting parser module.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parse_core_devs import extract_meeting_attendees
+
+
+class TestMeetingAttendees(unittest.TestCase):
+    """Test cases for meeting attendee extraction."""
+
+    def test_extract_meeting_attendees_deduplicates(self):
+        """Test that one attendee written differently by two patterns is listed once."""
+        notes = """# Meeting 12
+
+## Attendees
+- Alice (EF)
+- Bob
+
+Attendees: Alice(EF), Bob, Carol
+"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "Meeting 12.md"
+            file_path.write_text(notes)
+            result = extract_meeting_attendees(file_path)
+        
+        self.assertEqual(result.meeting_number, 12)
+        self.assertEqual(sorted(result.attendees), [('Alice', 'EF'), ('Bob', ''), ('Carol', '')])
+
+
+if __name__ == "__main__":
+    unittest.main()
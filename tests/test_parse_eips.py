@@ -9,10 +9,15 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
+import yaml
+
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.parse_eips import parse_eip_file, EipAuthor, EipMetadata
+from src.parse_eips import (
+    parse_eip_file, parse_eip_content, parse_eip_directory, parse_simple_frontmatter,
+    EipAuthor, EipMetadata
+)
 
 
 class TestEipParser(unittest.TestCase):
@@ -113,6 +118,150 @@ created: 2022-01-01
             
         self.assertIsNone(result)
 
+    def test_parse_eip_content_tab_in_frontmatter(self):
+        """Test that frontmatter with tabs is read as yaml.safe_load reads it."""
+        frontmatter = "eip: 7\ntitle: Tabbed\tTitle\nauthor: Test Author\nstatus: Draft"
+        
+        # libyaml accepts this tab where the pure-Python SafeLoader may not,
+        # so the parser has to give whichever result safe_load gives
+        try:
+            expected = yaml.safe_load(frontmatter)['title']
+        except yaml.YAMLError:
+            with self.assertRaises(yaml.YAMLError):
+                parse_eip_content(f"---\n{frontmatter}\n---\n", 7)
+        else:
+            result = parse_eip_content(f"---\n{frontmatter}\n---\n", 7)
+            self.assertEqual(result.title, expected)
+
+    def metadata_fields(self, metadata: EipMetadata) -> tuple:
+        """Collect an EipMetadata's fields for comparison."""
+        return tuple(getattr(metadata, field) for field in EipMetadata.__slots__)
+
+    def test_parse_eip_content_str_and_bytes(self):
+        """Test that text and UTF-8 bytes with CRLF newlines parse the same."""
+        content = """---
+eip: 55
+title: Mixed-case checksum address encoding
+author: Vitalik Buterin <vitalik.buterin@ethereum.org>, Alex Van de Sande (@alexvandesande), Jürgen (Ethereum Foundation)
+status: Final
+type: Standards Track
+category: ERC
+created: 2016-01-14
+---
+
+## Specification
+"""
+        
+        from_str = parse_eip_content(content, 55)
+        from_bytes = parse_eip_content(content.replace('\n', '\r\n').encode('utf-8'), 55)
+        
+        self.assertEqual(from_str.authors[2].name, "Jürgen")
+        self.assertEqual(self.metadata_fields(from_bytes), self.metadata_fields(from_str))
+
+    def test_parse_eip_directory_matches_serial(self):
+        """Test that parsing a directory in the process pool matches parsing file by file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            eips_dir = Path(tmp_dir)
+            # More files than one pool chunk, including ones that fail to parse
+            for number in range(1, 81):
+                if number % 10 == 0:
+                    content = "No frontmatter here.\n"
+                else:
+                    content = (f"---\neip: {number}\ntitle: Title {number}\n"
+                               f"author: Author {number} <author{number}@org{number % 3}.com>\n"
+                               f"status: {'Final' if number % 2 else 'Draft'}\ntype: Meta\n"
+                               f"created: 2020-01-01\n---\n")
+                (eips_dir / f"eip-{number}.md").write_text(content)
+            (eips_dir / "README.md").write_text("# Not an EIP\n")
+            
+            result = parse_eip_directory(eips_dir)
+            serial = [parse_eip_file(path) for path in eips_dir.glob('eip-*.md')]
+        
+        expected = [self.metadata_fields(metadata) for metadata in serial if metadata]
+        self.assertEqual(len(expected), 72)
+        self.assertEqual([self.metadata_fields(metadata) for metadata in result], expected)
+
+
+
+class TestSimpleFrontmatter(unittest.TestCase):
+    """Test cases for the "key: value" frontmatter fast path."""
+
+    def load_yaml(self, text: str):
+        """Load text with yaml.safe_load, returning the error type if it raises."""
+        try:
+            return yaml.safe_load(text)
+        except (yaml.YAMLError, ValueError) as e:
+            return type(e)
+
+    def test_parse_simple_frontmatter_matches_yaml(self):
+        """Test that plain EIP headers parse exactly as YAML parses them."""
+        frontmatter = """eip: 1
+title: EIP Purpose (and Guidelines)
+author: Martin Becze <mb@ethereum.org>, Hudson Jameson (@Souptacular)
+discussions-to: https://ethereum-magicians.org/t/eip-1/1
+status: Last Call
+last-call-deadline: 2020-01-01
+type: Standards Track
+category: ERC
+requires: 20, 721
+created: 2015-10-27
+withdrawal-count: 0"""
+        
+        self.assertEqual(parse_simple_frontmatter(frontmatter), self.load_yaml(frontmatter))
+
+    def test_parse_simple_frontmatter_falls_back(self):
+        """Test that headers YAML reads differently from their raw text fall back to YAML."""
+        fallback_cases = [
+            # Quoted values
+            'title: "Quoted"',
+            "title: 'Quoted'",
+            # Booleans and nulls
+            'status: yes',
+            'status: no',
+            'status: On',
+            'category: null',
+            'category: ~',
+            # Integers YAML reads as octal, hex or with separators, and floats
+            'eip: 012',
+            'eip: 0x1F',
+            'eip: 1_000',
+            'eip: +5',
+            'eip: 1.5',
+            # Timestamps with a time, and invalid dates
+            'created: 2020-01-01 10:00:00',
+            'created: 2020-02-30',
+            # Inline comments
+            'title: Foo # comment',
+            # Values containing or ending with ": "
+            'title: Foo: Bar',
+            'title: Foo:',
+            # Continuation and indented lines
+            'title: Foo\n  continued',
+            'author:\n  - Alice',
+            ' title: Foo',
+            # Tabs
+            'title: Foo\tBar',
+            'title:\tFoo',
+            # Non-string keys, collections, anchors, tags and block scalars
+            'yes: x',
+            '1: x',
+            'title: [a, b]',
+            'title: &a x',
+            'title: !!str x',
+            'title: |',
+            'title: @x',
+            # Empty frontmatter
+            '',
+        ]
+        
+        for frontmatter in fallback_cases:
+            with self.subTest(frontmatter=frontmatter):
+                self.assertIsNone(parse_simple_frontmatter(frontmatter))
+                
+                # Reading the lines as raw "key: value" strings would disagree with YAML
+                raw_fields = dict(line.partition(': ')[::2] for line in frontmatter.split('\n') if line)
+                self.assertNotEqual(self.load_yaml(frontmatter), raw_fields)
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
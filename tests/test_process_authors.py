@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the author organization mapping script.
+"""
+
+import os
+import tempfile
+import unittest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from process_authors import process_authors_data
+
+
+class TestProcessAuthors(unittest.TestCase):
+    """Test cases for process_authors_data."""
+
+    def process_csv(self, content: str) -> dict:
+        """Write content to a temporary authors CSV and process it."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "authors.csv")
+            with open(csv_path, 'w') as f:
+                f.write(content)
+            return process_authors_data(csv_path)
+
+    def test_process_authors_email_without_at(self):
+        """Test an email without '@', which has no domain to infer from."""
+        result = self.process_csv(
+            "EIP,Author Name,Author Email,Author GitHub,Organization\n"
+            "1,Alice,foo,,\n"
+        )
+
+        self.assertEqual(list(result), ['Alice'])
+        self.assertEqual(result['Alice']['emails'], ['foo'])
+        self.assertEqual(result['Alice']['inferred_organizations'], [])
+
+    def test_process_authors_skips_authors_without_details(self):
+        """Test that authors with no email, handle or organization are left out."""
+        result = self.process_csv(
+            "EIP,Author Name,Author Email,Author GitHub,Organization\n"
+            "1,Alice,,,\n"
+            "2,Bob,bob@ethereum.org,bob,\n"
+        )
+
+        self.assertEqual(list(result), ['Bob'])
+        self.assertEqual(result['Bob']['github_handles'], ['bob'])
+        self.assertEqual(result['Bob']['inferred_organizations'], ['Ethereum'])
+
+
+if __name__ == "__main__":
+    unittest.main()